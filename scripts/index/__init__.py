@@ -0,0 +1,16 @@
+"""
+Index module for local similarity search over resume analysis results.
+
+This module provides a CPU embedding model and a memory-mapped vector index
+that supports nearest-neighbour queries and semantic re-ranking without LLM calls.
+"""
+
+from .embedder import LocalEmbedder, DEFAULT_EMBEDDING_MODEL
+from .vector_index import VectorIndex, INDEX_DIR_NAME
+
+__all__ = [
+    'LocalEmbedder',
+    'DEFAULT_EMBEDDING_MODEL',
+    'VectorIndex',
+    'INDEX_DIR_NAME'
+]
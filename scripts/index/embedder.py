@@ -0,0 +1,49 @@
+"""
+Local CPU embedding model for resume similarity search.
+
+This module wraps a small sentence-transformers model so that resumes and
+reviews can be embedded without any LLM or network calls after the first download.
+"""
+
+from typing import Any, List, Optional
+
+import numpy as np
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class LocalEmbedder:
+
+    def __init__(self, model_name: str = DEFAULT_EMBEDDING_MODEL, batch_size: int = 32) -> None:
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._model: Optional[Any] = None
+
+    @property
+    def model(self) -> Any:
+        if self._model is None:
+            try:
+                # Import here to avoid dependency if not using the index
+                from sentence_transformers import SentenceTransformer
+                self._model = SentenceTransformer(self.model_name, device="cpu")
+            except ImportError:
+                raise ImportError(
+                    "sentence-transformers package is not installed. "
+                    "Install it with 'pip install sentence-transformers'"
+                )
+        return self._model
+
+    def load(self) -> None:
+        """Load the model now rather than on the first call to embed."""
+        _ = self.model
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts as L2-normalised float32 rows, so a dot product is cosine similarity."""
+        vectors = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return np.asarray(vectors, dtype=np.float32)
@@ -0,0 +1,293 @@
+"""
+Memory-mapped vector index over saved resume analysis results.
+
+Vectors are appended to a raw float32 file that is memory-mapped for search,
+and record metadata, including each record's row in that file, is kept in a
+JSON file next to it. Documents are keyed by a hash of their markdown and review
+files so only new or changed results are embedded on each update.
+
+The metadata file is the source of truth: it is replaced atomically, rows past
+the count it records are discarded before appending, and compaction writes a new
+vectors file before switching the metadata over to it, so a crash can lose work
+but not misalign records and vectors. Updates hold an exclusive lock on a lock
+file from loading the metadata to saving it, so overlapping updates from several
+processes run one after another.
+"""
+
+import glob
+import hashlib
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from scripts.index.embedder import LocalEmbedder
+from scripts.parser.file_utils import load_json, load_text, save_json
+from scripts.parser.segmenter import split_candidates
+
+INDEX_DIR_NAME = "index"
+VECTORS_FILE = "vectors.f32"
+METADATA_FILE = "metadata.json"
+LOCK_FILE = "index.lock"
+
+# Rewrite the vectors file once this fraction of its rows belong to replaced or deleted results
+COMPACT_STALE_FRACTION = 0.25
+
+
+def document_hash(*file_paths: str) -> str:
+    digest = hashlib.sha256()
+    for file_path in file_paths:
+        if os.path.exists(file_path):
+            with open(file_path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+@contextmanager
+def _exclusive_lock(lock_file: str) -> Iterator[None]:
+    """Hold an exclusive lock on lock_file, waiting for other processes to release it."""
+    with open(lock_file, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+            while True:
+                try:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _match_name(segment: str, names: List[str]) -> Optional[str]:
+    """Attribute a resume segment to the reviewed candidate whose name it mentions first."""
+    lowered = segment.lower()
+    positions = [(lowered.find(n.lower()), n) for n in names if n and n.lower() in lowered]
+    return min(positions)[1] if positions else None
+
+
+class VectorIndex:
+
+    def __init__(self, index_dir: str, embedder: Optional[LocalEmbedder] = None) -> None:
+        self.index_dir = index_dir
+        self.embedder = embedder or LocalEmbedder()
+        self.metadata_file = os.path.join(index_dir, METADATA_FILE)
+        self.lock_file = os.path.join(index_dir, LOCK_FILE)
+        self._vectors: Optional[np.ndarray] = None
+        self._load_metadata()
+
+        if self.records and self.metadata["model"] != self.embedder.model_name:
+            raise ValueError(
+                f"Index at {index_dir} was built with {self.metadata['model']}, "
+                f"not {self.embedder.model_name}. Delete it to rebuild."
+            )
+
+    def _load_metadata(self) -> None:
+        if os.path.exists(self.metadata_file):
+            self.metadata = load_json(self.metadata_file)
+        else:
+            self.metadata = {
+                "model": self.embedder.model_name,
+                "dim": 0,
+                "rows": 0,
+                "vectors_file": VECTORS_FILE,
+                "generation": 0,
+                "documents": {},
+                "records": [],
+            }
+        self._vectors = None
+
+    def _save_metadata(self) -> None:
+        # Write then rename so readers never see a partially written file
+        tmp_file = self.metadata_file + ".tmp"
+        save_json(self.metadata, tmp_file)
+        os.replace(tmp_file, self.metadata_file)
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        return self.metadata["records"]
+
+    @property
+    def vectors_file(self) -> str:
+        return os.path.join(self.index_dir, self.metadata["vectors_file"])
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Memory-mapped (rows, dim) matrix; each record's "row" indexes into it."""
+        if self._vectors is None:
+            if not self.metadata["rows"]:
+                self._vectors = np.zeros((0, self.metadata["dim"]), dtype=np.float32)
+            else:
+                self._vectors = np.memmap(
+                    self.vectors_file,
+                    dtype=np.float32,
+                    mode="r",
+                    shape=(self.metadata["rows"], self.metadata["dim"]),
+                )
+        return self._vectors
+
+    def _is_current(self, record: Dict[str, Any]) -> bool:
+        return self.metadata["documents"].get(record["source"]) == record["doc_hash"]
+
+    def _document_records(self, json_file: Path, doc_hash: str) -> List[Dict[str, Any]]:
+        reviews = load_json(str(json_file))
+        md_file = json_file.with_suffix(".md")
+        names = [r.get("name", "") for r in reviews]
+
+        records = []
+        for review in reviews:
+            records.append({
+                "kind": "review",
+                "name": review.get("name", "Unknown"),
+                "ai_ml_experience_score": review.get("ai_ml_experience_score", 0),
+                "well_known_software_company_experience": review.get("well_known_software_company_experience", 0),
+                "text": review.get("reason_for_score", ""),
+            })
+        if md_file.exists():
+            for segment in split_candidates(load_text(str(md_file))):
+                records.append({"kind": "resume", "name": _match_name(segment, names), "text": segment})
+
+        for record in records:
+            record["source"] = json_file.stem
+            record["doc_hash"] = doc_hash
+        return [r for r in records if r["text"]]
+
+    def _append_vectors(self, vectors: np.ndarray) -> None:
+        """Append rows after the last row the metadata knows about, dropping any orphans."""
+        self._vectors = None
+        os.makedirs(self.index_dir, exist_ok=True)
+        known_bytes = self.metadata["rows"] * self.metadata["dim"] * np.dtype(np.float32).itemsize
+        mode = "r+b" if os.path.exists(self.vectors_file) else "w+b"
+        with open(self.vectors_file, mode) as f:
+            f.truncate(known_bytes)
+            f.seek(known_bytes)
+            f.write(vectors.tobytes())
+
+    def _compact(self) -> None:
+        """Rewrite the vectors file with only the rows of current records."""
+        current = [r for r in self.records if self._is_current(r)]
+        rows = [r["row"] for r in current]
+
+        self.metadata["generation"] += 1
+        vectors_file = f"vectors-{self.metadata['generation']}.f32"
+        with open(os.path.join(self.index_dir, vectors_file), "wb") as f:
+            f.write(np.ascontiguousarray(self.vectors[rows]).tobytes())
+
+        self._vectors = None
+        for row, record in enumerate(current):
+            record["row"] = row
+        self.metadata["records"] = current
+        self.metadata["rows"] = len(current)
+        self.metadata["vectors_file"] = vectors_file
+        self._save_metadata()
+
+        # Older files may still be mapped by a running query, which blocks removal on Windows;
+        # any left behind are removed by the next compaction
+        for old_file in glob.glob(os.path.join(self.index_dir, "vectors*.f32")):
+            if os.path.basename(old_file) != vectors_file:
+                try:
+                    os.remove(old_file)
+                except OSError:
+                    pass
+
+    def update(self, results_dir: str) -> int:
+        """Embed results in results_dir that are new or changed, and forget deleted ones."""
+        os.makedirs(self.index_dir, exist_ok=True)
+        with _exclusive_lock(self.lock_file):
+            return self._update(results_dir)
+
+    def _update(self, results_dir: str) -> int:
+        # Pick up changes made by another process since this index was opened
+        self._load_metadata()
+        documents = self.metadata["documents"]
+
+        json_files = {f.stem: f for f in sorted(Path(results_dir).glob("*.json"))}
+        removed = [source for source in documents if source not in json_files]
+        for source in removed:
+            del documents[source]
+
+        new_records = []
+        new_documents = {}
+        for source, json_file in json_files.items():
+            doc_hash = document_hash(str(json_file), str(json_file.with_suffix(".md")))
+            if documents.get(source) == doc_hash:
+                continue
+            new_records.extend(self._document_records(json_file, doc_hash))
+            new_documents[source] = doc_hash
+
+        if new_records:
+            vectors = self.embedder.embed([r["text"] for r in new_records])
+            self.metadata["dim"] = int(vectors.shape[1])
+            self.metadata["model"] = self.embedder.model_name
+            self._append_vectors(vectors)
+            for offset, record in enumerate(new_records):
+                record["row"] = self.metadata["rows"] + offset
+            self.metadata["rows"] += len(new_records)
+            self.records.extend(new_records)
+
+        if not removed and not new_documents:
+            return 0
+
+        documents.update(new_documents)
+        stale = sum(1 for r in self.records if not self._is_current(r))
+        if self.metadata["rows"] and stale / self.metadata["rows"] > COMPACT_STALE_FRACTION:
+            self._compact()
+        else:
+            self._save_metadata()
+        return len(new_records)
+
+    def candidate_vector(self, name: str) -> np.ndarray:
+        """Mean of the current vectors attributed to a candidate, for "similar to" queries."""
+        rows = [
+            r["row"] for r in self.records
+            if self._is_current(r) and (r["name"] or "").strip().lower() == name.strip().lower()
+        ]
+        if not rows:
+            raise ValueError(f"Candidate not found in index: {name}")
+        vector = self.vectors[rows].mean(axis=0)
+        return vector / np.linalg.norm(vector)
+
+    def search(self, query: np.ndarray, top_k: int = 10, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the top_k current records by cosine similarity to a query vector."""
+        candidates = [
+            r for r in self.records
+            if self._is_current(r) and (kind is None or r["kind"] == kind)
+        ]
+        top_k = min(top_k, len(candidates))
+        if top_k <= 0:
+            return []
+
+        scores = self.vectors[[r["row"] for r in candidates]] @ query.astype(np.float32)
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top])]
+        return [{**candidates[i], "similarity": float(scores[i])} for i in top]
+
+    def rank_candidates(self, query: np.ndarray, top_k: int = 10) -> List[Dict[str, Any]]:
+        """Re-rank reviewed candidates by their best matching record for the query."""
+        best: Dict[str, Dict[str, Any]] = {}
+        for hit in self.search(query, top_k=len(self.records)):
+            name = hit["name"]
+            if not name:
+                continue
+            key = name.strip().lower()
+            if key not in best:
+                best[key] = {"name": name, "similarity": hit["similarity"]}
+            if hit["kind"] == "review" and "ai_ml_experience_score" not in best[key]:
+                best[key]["ai_ml_experience_score"] = hit["ai_ml_experience_score"]
+                best[key]["well_known_software_company_experience"] = hit["well_known_software_company_experience"]
+                best[key]["reason_for_score"] = hit["text"]
+        return list(best.values())[:top_k]
@@ -23,6 +23,7 @@ from tqdm import tqdm
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from scripts.parser.docling_parser import DoclingParser
+from scripts.index import VectorIndex, INDEX_DIR_NAME
 from scripts.llm.openai import OpenAILLM, AVAILABLE_MODELS as AVAILABLE_OPENAI_MODELS
 from scripts.llm.gemini import GeminiLLM, AVAILABLE_MODELS as AVAILABLE_GEMINI_MODELS
 from scripts.llm.bedrock import BedrockLLM, AVAILABLE_MODELS as AVAILABLE_BEDROCK_MODELS
@@ -120,6 +121,9 @@ Examples:
   
   # Use specific OpenAI model
   python scripts/parse_resumes.py -i resumes/ -o results/ --model gpt-4o
+  
+  # Also update the similarity search index
+  python scripts/parse_resumes.py -i resumes/ -o results/ --index
         """
     )
     
@@ -142,6 +146,61 @@ Examples:
         help='Model to use (default: gemini-2.5-pro)'
     )
     
+    parser.add_argument(
+        '--concurrency', '-c',
+        type=int,
+        default=8,
+        help='Maximum number of candidates scored concurrently per file (default: 8)'
+    )
+    
+    parser.add_argument(
+        '--max-pages',
+        type=int,
+        default=50,
+        help='Convert PDFs with more pages using MarkItDown instead of Docling (default: 50)'
+    )
+    
+    parser.add_argument(
+        '--max-file-size-mb',
+        type=float,
+        default=20,
+        help='Convert larger PDFs using MarkItDown instead of Docling (default: 20)'
+    )
+    
+    parser.add_argument(
+        '--conversion-timeout',
+        type=float,
+        default=180,
+        help='Seconds before a Docling conversion is killed and retried with MarkItDown (default: 180)'
+    )
+    
+    parser.add_argument(
+        '--worker-startup-timeout',
+        type=float,
+        default=600,
+        help='Seconds allowed for a Docling worker to load its models before falling back to MarkItDown (default: 600)'
+    )
+    
+    parser.add_argument(
+        '--worker-max-documents',
+        type=int,
+        default=50,
+        help='Restart the Docling worker after this many documents (default: 50)'
+    )
+    
+    parser.add_argument(
+        '--worker-max-rss-mb',
+        type=float,
+        default=4096,
+        help='Restart the Docling worker when its memory exceeds this many MB (default: 4096)'
+    )
+    
+    parser.add_argument(
+        '--index',
+        action='store_true',
+        help='Update the local embedding index used by scripts/query_resumes.py'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -150,6 +209,9 @@ Examples:
     
     args = parser.parse_args()
     
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    
     # Create output directory
     os.makedirs(args.output, exist_ok=True)
     
@@ -174,13 +236,25 @@ Examples:
     else:
         print(f"Model {args.model} is not supported. Available models: {AVAILABLE_MODELS}")
         sys.exit(1)
-    docling_parser = DoclingParser(llm)
+    docling_parser = DoclingParser(
+        llm,
+        max_concurrency=args.concurrency,
+        max_pages=args.max_pages,
+        max_file_size_mb=args.max_file_size_mb,
+        timeout=args.conversion_timeout,
+        startup_timeout=args.worker_startup_timeout,
+        max_documents_per_worker=args.worker_max_documents,
+        max_worker_rss_mb=args.worker_max_rss_mb
+    )
     
     # Process all PDF files
     candidates = []
-    for pdf_path in tqdm(pdf_files):
-        results = await parse_resume_file(docling_parser, pdf_path, args.output)
-        candidates.extend(results)
+    try:
+        for pdf_path in tqdm(pdf_files):
+            results = await parse_resume_file(docling_parser, pdf_path, args.output)
+            candidates.extend(results)
+    finally:
+        docling_parser.close()
     
     # Deduplicate candidates by name (keep first occurrence)
     seen_names = set()
@@ -197,6 +271,11 @@ Examples:
     # Print results
     print_resume_reviews(unique_candidates)
     print(f"\nAnalysis files saved in: {args.output}")
+    
+    if args.index:
+        index = VectorIndex(os.path.join(args.output, INDEX_DIR_NAME))
+        added = index.update(args.output)
+        print(f"Index updated with {added} new record(s): {index.index_dir}")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
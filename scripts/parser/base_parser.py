@@ -5,77 +5,51 @@ This module defines the abstract base class that all document parsers must imple
 """
 
 from abc import ABC, abstractmethod
+import asyncio
+import hashlib
 import os
 from typing import List, Any
-import json
 
 from scripts.llm.base_llm import BaseLLM
 from scripts.parser.candidate_models import CandidateReview
+from scripts.parser.file_utils import ensure_directory, load_json, save_json, load_text, save_text
+from scripts.parser.segmenter import split_candidates
 from scripts.prompts import RESUME_ANALYSIS_PROMPT
 
-def ensure_directory(file_path: str) -> str:
-    if not file_path:
-        raise ValueError("File path cannot be empty")
-        
-    try:
-        directory = os.path.dirname(os.path.abspath(file_path))
-        if directory:
-            os.makedirs(directory, exist_ok=True)
-        return directory
-    except Exception as e:
-        raise IOError(f"Failed to create directory for {file_path}: {str(e)}") from e
-
-def load_json(file_path: str) -> List[str]:
-    try:
-        with open(file_path, "r", encoding='utf-8') as f:
-            data = json.load(f)
-            
-        return data
-    except FileNotFoundError:
-        raise FileNotFoundError(f"File not found: {file_path}")
-    except json.JSONDecodeError:
-        raise ValueError(f"Invalid JSON format in {file_path}")
-       
-def save_json(data: List[Any], file_path: str) -> None:
-
-    try:
-        ensure_directory(file_path)
-        
-        with open(file_path, "w", encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
-            
-    except Exception as e:
-        raise IOError(f"Failed to save file: {str(e)}") from e
-
-def load_text(file_path: str) -> str:
-    try:
-        with open(file_path, "r", encoding='utf-8') as f:
-            text = f.read()
-            
-        return text
-    except FileNotFoundError:
-        raise FileNotFoundError(f"File not found: {file_path}")
-    except Exception as e:
-        raise IOError(f"Failed to read text file: {str(e)}") from e
-    
-def save_text(text: str, file_path: str) -> None:
-    try:
-        ensure_directory(file_path)
-        
-        with open(file_path, "w", encoding='utf-8') as f:
-            f.write(text)
-            
-    except Exception as e:
-        raise IOError(f"Failed to save text file: {str(e)}") from e
-
 class BaseMDParser(ABC):
-    def __init__(self, llm: BaseLLM) -> None:
+    def __init__(self, llm: BaseLLM, max_concurrency: int = 8) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
         self.llm = llm
+        self.max_concurrency = max_concurrency
 
     @abstractmethod
     def _parse_file(self, file_path: str) -> str:
         pass
 
+    async def _review_segments(self, segments: List[str], cache_dir: str) -> List[Any]:
+        """
+        Score each candidate segment with its own LLM call, running up to max_concurrency at once.
+
+        Each successful result is cached in cache_dir under a hash of its segment,
+        so a rerun only pays for the segments that failed.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def review(segment: str) -> List[Any]:
+            cache_file = os.path.join(cache_dir, hashlib.sha256(segment.encode('utf-8')).hexdigest() + '.json')
+            if os.path.exists(cache_file):
+                return load_json(cache_file)
+
+            async with semaphore:
+                prompt = RESUME_ANALYSIS_PROMPT.format(text=segment)
+                results = await self.llm.generate(prompt, output_type=List[CandidateReview])
+            results = [r.__dict__ for r in results]
+            save_json(results, cache_file)
+            return results
+
+        return await asyncio.gather(*(review(s) for s in segments), return_exceptions=True)
+
     async def parse_file(self, file_path: str, output_file: str) -> List[Any]:
         try:
             # Create output directory if it doesn't exist
@@ -95,10 +69,30 @@ class BaseMDParser(ABC):
                 markdown_content = self._parse_file(file_path)
                 save_text(markdown_content, md_file)
             
-            prompt = RESUME_ANALYSIS_PROMPT.format(text=markdown_content)
-            review_results = await self.llm.generate(prompt, output_type=List[CandidateReview])
-            review_results = [r.__dict__ for r in review_results]
-            save_json(review_results, output_file)
+            segments = split_candidates(markdown_content)
+            segment_results = await self._review_segments(segments, output_file.replace('.json', '_segments'))
+
+            review_results = []
+            failed = 0
+            for i, result in enumerate(segment_results, 1):
+                if isinstance(result, Exception):
+                    failed += 1
+                    print(f"Segment {i} of {len(segments)} in {file_path} failed: {result}")
+                    continue
+                review_results.extend(result)
+
+            # Reassemble in ranking order, as a single whole-document call would return them
+            review_results.sort(
+                key=lambda x: (x['ai_ml_experience_score'], x['well_known_software_company_experience']),
+                reverse=True
+            )
+
+            if failed:
+                # Leave the JSON unsaved so the failed segments are retried on the next run;
+                # segments that succeeded are reused from their cache
+                print(f"{failed} of {len(segments)} candidate segments failed in {file_path}")
+            else:
+                save_json(review_results, output_file)
 
             return review_results
             
@@ -0,0 +1,208 @@
+"""
+Process-isolated document conversion.
+
+Conversion libraries hold large model buffers and can hang or crash on malformed
+documents. This module runs them in child processes that are recycled, timed out
+and killed without affecting the parent. It only imports the standard library and
+the segmenter, so the worker entry points do not pull in the LLM stack themselves.
+
+Workers are started with the "spawn" method, which re-imports the launching
+script in every child. Memory used by that script's own imports therefore counts
+towards each worker's RSS.
+"""
+
+import multiprocessing
+import os
+import sys
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from scripts.parser.segmenter import PAGE_BREAK
+
+# Conversion statuses
+OK = "ok"
+ERROR = "error"
+TIMEOUT = "timeout"
+CRASHED = "crashed"
+
+# Spawn rather than fork so workers do not inherit the parent's memory
+_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def current_rss_mb() -> float:
+    """Resident set size of the current process in MB, or 0.0 where it cannot be measured."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows, where memory-based recycling is disabled
+        return 0.0
+    # Peak RSS is the best available estimate off Linux (bytes on macOS, KB elsewhere)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def docling_worker(conn: Any, config: Dict[str, Any]) -> None:
+    """Load Docling, report "ready", then convert documents received over conn until told to stop with None."""
+    try:
+        from docling.datamodel.base_models import InputFormat
+        from docling.document_converter import DocumentConverter
+        converter = DocumentConverter(**config)
+        # Load the PDF models now so per-document timeouts do not include startup
+        converter.initialize_pipeline(InputFormat.PDF)
+    except ImportError:
+        conn.send((ERROR, "Docling package is not installed. Install it with 'pip install docling'", current_rss_mb()))
+        conn.close()
+        return
+    except Exception as e:
+        conn.send((ERROR, str(e), current_rss_mb()))
+        conn.close()
+        return
+    conn.send(("ready", None, current_rss_mb()))
+
+    while True:
+        request = conn.recv()
+        if request is None:
+            break
+        file_path, max_num_pages, max_file_size = request
+        try:
+            result = converter.convert(file_path, max_num_pages=max_num_pages, max_file_size=max_file_size)
+            # Keep page boundaries so multi-candidate documents can be segmented
+            markdown = result.document.export_to_markdown(page_break_placeholder=PAGE_BREAK)
+            conn.send((OK, markdown, current_rss_mb()))
+        except Exception as e:
+            conn.send((ERROR, str(e), current_rss_mb()))
+    conn.close()
+
+
+def markitdown_worker(conn: Any, file_path: str) -> None:
+    """Convert a single document with MarkItDown and send the result over conn."""
+    try:
+        # Same conversion as MarkItDownParser, without importing the LLM stack into the child
+        from markitdown import MarkItDown
+        result = MarkItDown(enable_plugins=True).convert(file_path)
+        conn.send((OK, result.markdown, current_rss_mb()))
+    except Exception as e:
+        conn.send((ERROR, str(e), current_rss_mb()))
+    conn.close()
+
+
+def _terminate(process: Any, conn: Any) -> None:
+    if process.is_alive():
+        process.terminate()
+    process.join()
+    conn.close()
+
+
+def run_isolated(target: Callable[..., None], args: Tuple[Any, ...], timeout: float) -> Tuple[str, str]:
+    """Run a one-shot conversion target in a short-lived child process, killing it after timeout seconds."""
+    conn, child_conn = _CONTEXT.Pipe()
+    process = _CONTEXT.Process(target=target, args=(child_conn,) + args, daemon=True)
+    process.start()
+    child_conn.close()
+    try:
+        if not conn.poll(timeout):
+            return TIMEOUT, f"timed out after {timeout}s"
+        status, payload, _ = conn.recv()
+        return status, payload
+    except (EOFError, OSError):
+        return CRASHED, "conversion process exited unexpectedly"
+    finally:
+        _terminate(process, conn)
+
+
+class ConversionWorker:
+    """
+    Long-lived conversion process that is recycled after max_documents documents
+    or once its RSS exceeds max_rss_mb, and killed when a document exceeds timeout.
+
+    The target is called as target(conn, config). It must send ("ready", None, rss)
+    once loaded, or (ERROR, message, rss) if it cannot start, then answer each
+    request tuple with (status, payload, rss) until it receives None.
+    """
+
+    def __init__(
+        self,
+        target: Callable[[Any, Dict[str, Any]], None],
+        config: Dict[str, Any],
+        timeout: float,
+        startup_timeout: float,
+        max_documents: int,
+        max_rss_mb: float
+    ) -> None:
+        self.target = target
+        self.config = config
+        self.timeout = timeout
+        self.startup_timeout = startup_timeout
+        self.max_documents = max_documents
+        self.max_rss_mb = max_rss_mb
+        self.process: Optional[Any] = None
+        self.documents = 0
+        self.startup_error: Optional[str] = None
+        self._conn: Optional[Any] = None
+
+    def _start(self) -> Optional[str]:
+        """Start a worker and wait until it is ready, returning an error message on failure."""
+        self._conn, child_conn = _CONTEXT.Pipe()
+        self.process = _CONTEXT.Process(target=self.target, args=(child_conn, self.config), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.documents = 0
+
+        # Model loading, and downloading on a cold cache, gets its own longer timeout
+        try:
+            if not self._conn.poll(self.startup_timeout):
+                self.stop(kill=True)
+                return f"worker did not start within {self.startup_timeout}s"
+            status, payload, _ = self._conn.recv()
+        except (EOFError, OSError):
+            self.stop(kill=True)
+            return "conversion worker exited during startup"
+        if status != "ready":
+            self.stop(kill=True)
+            return f"worker failed to start: {payload}"
+        return None
+
+    def stop(self, kill: bool = False) -> None:
+        if self.process is None:
+            return
+        if not kill:
+            try:
+                self._conn.send(None)
+                self.process.join(timeout=10)
+            except (OSError, EOFError):
+                pass
+        _terminate(self.process, self._conn)
+        self.process = None
+        self._conn = None
+
+    def convert(self, *request: Any) -> Tuple[str, str]:
+        """Send a request to the worker, starting it if needed, and return (status, payload)."""
+        if self.startup_error:
+            return ERROR, self.startup_error
+        if self.process is None:
+            # A worker that cannot start will not start for the next document either
+            self.startup_error = self._start()
+            if self.startup_error:
+                return ERROR, self.startup_error
+
+        try:
+            self._conn.send(request)
+            if not self._conn.poll(self.timeout):
+                self.stop(kill=True)
+                return TIMEOUT, f"timed out after {self.timeout}s"
+            status, payload, rss_mb = self._conn.recv()
+        except (EOFError, OSError):
+            # The worker died mid-conversion, most likely killed for running out of memory
+            self.stop(kill=True)
+            return CRASHED, "conversion worker exited unexpectedly"
+
+        self.documents += 1
+        if self.documents >= self.max_documents or rss_mb >= self.max_rss_mb:
+            self.stop()
+        return status, payload
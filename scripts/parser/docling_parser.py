@@ -3,38 +3,68 @@ Docling-based parser implementation for document conversion to markdown.
 
 This module provides a parser implementation that uses the Docling library
 to convert various document formats to markdown.
+
+Conversion runs in a separate worker process so that memory held by Docling's
+models and page images is returned to the OS when the worker is recycled, and so
+that a slow or malformed document can be killed without stalling the whole run.
+Documents that exceed the page, size or time limits fall back to MarkItDown,
+which runs in its own short-lived process under the same timeout.
 """
 
 import os
-from typing import Optional, Any
+from typing import Any
 
 from .base_parser import BaseMDParser
+from .conversion_worker import OK, ConversionWorker, docling_worker, markitdown_worker, run_isolated
 from scripts.llm.base_llm import BaseLLM
 
 
 class DoclingParser(BaseMDParser):
 
-    def __init__(self, llm: BaseLLM, **kwargs: Any) -> None:
-        super().__init__(llm)
+    def __init__(
+        self,
+        llm: BaseLLM,
+        max_concurrency: int = 8,
+        max_pages: int = 50,
+        max_file_size_mb: float = 20,
+        timeout: float = 180,
+        startup_timeout: float = 600,
+        max_documents_per_worker: int = 50,
+        max_worker_rss_mb: float = 4096,
+        **kwargs: Any
+    ) -> None:
+        super().__init__(llm, max_concurrency)
         self.config = kwargs
-        self._converter: Optional[Any] = None
-    
-    @property
-    def converter(self) -> Any:
-        if self._converter is None:
-            try:
-                # Import here to avoid dependency if not using this parser
-                from docling.document_converter import DocumentConverter
-                self._converter = DocumentConverter(**self.config)
-            except ImportError:
-                raise ImportError(
-                    "Docling package is not installed. "
-                    "Install it with 'pip install docling'"
-                )
-        return self._converter
+        self.max_pages = max_pages
+        self.max_file_size_mb = max_file_size_mb
+        self.timeout = timeout
+        self._worker = ConversionWorker(
+            docling_worker,
+            self.config,
+            timeout=timeout,
+            startup_timeout=startup_timeout,
+            max_documents=max_documents_per_worker,
+            max_rss_mb=max_worker_rss_mb
+        )
+
+    def close(self) -> None:
+        """Stop the conversion worker."""
+        self._worker.stop()
 
     def _parse_file(self, file_path: str) -> str:
-        # Convert the document
-        result = self.converter.convert(file_path)
-        return result.document.export_to_markdown()
+        max_file_size = int(self.max_file_size_mb * 1024 * 1024)
+        if os.path.getsize(file_path) > max_file_size:
+            error = f"larger than {self.max_file_size_mb} MB"
+        else:
+            status, result = self._worker.convert(file_path, self.max_pages, max_file_size)
+            if status == OK:
+                return result
+            error = result
+
+        print(f"Docling conversion failed for {file_path} ({error}), falling back to MarkItDown")
+        status, result = run_isolated(markitdown_worker, (file_path,), self.timeout)
+        if status == OK:
+            return result
 
+        print(f"Skipping {file_path}: MarkItDown conversion failed ({result})")
+        raise ValueError(f"Failed to convert document: {result}")
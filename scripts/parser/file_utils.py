@@ -0,0 +1,65 @@
+"""
+File helpers for reading and writing parser outputs.
+
+This module has no LLM dependencies so that tools working only on saved
+results can use it without the LLM providers installed.
+"""
+
+import os
+from typing import List, Any
+import json
+
+def ensure_directory(file_path: str) -> str:
+    if not file_path:
+        raise ValueError("File path cannot be empty")
+        
+    try:
+        directory = os.path.dirname(os.path.abspath(file_path))
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return directory
+    except Exception as e:
+        raise IOError(f"Failed to create directory for {file_path}: {str(e)}") from e
+
+def load_json(file_path: str) -> List[str]:
+    try:
+        with open(file_path, "r", encoding='utf-8') as f:
+            data = json.load(f)
+            
+        return data
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}")
+    except json.JSONDecodeError:
+        raise ValueError(f"Invalid JSON format in {file_path}")
+       
+def save_json(data: List[Any], file_path: str) -> None:
+
+    try:
+        ensure_directory(file_path)
+        
+        with open(file_path, "w", encoding='utf-8') as f:
+            json.dump(data, f, indent=4)
+            
+    except Exception as e:
+        raise IOError(f"Failed to save file: {str(e)}") from e
+
+def load_text(file_path: str) -> str:
+    try:
+        with open(file_path, "r", encoding='utf-8') as f:
+            text = f.read()
+            
+        return text
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}")
+    except Exception as e:
+        raise IOError(f"Failed to read text file: {str(e)}") from e
+    
+def save_text(text: str, file_path: str) -> None:
+    try:
+        ensure_directory(file_path)
+        
+        with open(file_path, "w", encoding='utf-8') as f:
+            f.write(text)
+            
+    except Exception as e:
+        raise IOError(f"Failed to save text file: {str(e)}") from e
@@ -5,18 +5,20 @@ This module provides a parser implementation that uses the Microsoft MarkItDown
 (https://github.com/microsoft/markitdown) to convert various document formats to markdown.
 """
 
+import logging
 import os
 from typing import Optional, Any
 
 from .base_parser import BaseMDParser
 from scripts.llm.base_llm import BaseLLM
 
+logger = logging.getLogger(__name__)
 
 
 class MarkItDownParser(BaseMDParser):
 
-    def __init__(self, llm: BaseLLM, **kwargs: Any) -> None:
-        super().__init__(llm)
+    def __init__(self, llm: BaseLLM, max_concurrency: int = 8, **kwargs: Any) -> None:
+        super().__init__(llm, max_concurrency)
         self.config = kwargs
         self._converter: Optional[Any] = None
     
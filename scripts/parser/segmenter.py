@@ -0,0 +1,208 @@
+"""
+Candidate segmentation for multi-resume documents.
+
+This module splits the markdown of a combined PDF into one segment per candidate
+so that each resume can be scored by an independent LLM call.
+"""
+
+import logging
+import re
+from typing import List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Placeholder emitted between pages when exporting to markdown
+PAGE_BREAK = "<!-- page break -->"
+
+# Number of leading lines inspected when looking for a contact header
+HEADER_LINES = 8
+
+# Segments shorter than this are fragments of a resume rather than a whole one
+MIN_SEGMENT_CHARS = 200
+
+# Words that mark a line as a resume section or banner rather than a person's name
+SECTION_WORDS = {
+    "about", "achievements", "activities", "awards", "background", "certifications",
+    "contact", "courses", "curriculum", "cv", "details", "education", "employment",
+    "experience", "history", "information", "interests", "languages", "objective",
+    "personal", "professional", "profile", "projects", "publications", "qualifications", "references",
+    "resume", "skills", "summary", "technical", "training", "vitae", "volunteer", "work",
+}
+
+# Words of banners such as "RESUME" or "Curriculum Vitae" that open a resume
+BANNER_WORDS = {"curriculum", "cv", "resume", "vitae"}
+
+# Connectives allowed inside section titles such as "Skills and Interests"
+_CONNECTIVES = {"and", "of", "the"}
+
+_PAGE_SPLIT_RE = re.compile(r"\s*(?:" + re.escape(PAGE_BREAK) + r"|\f)\s*")
+_HEADING_RE = re.compile(r"^#{1,2}\s+\S")
+_PLACEHOLDER_RE = re.compile(r"^<!--.*-->$")
+_NAME_WORD_RE = re.compile(r"^[A-Z][A-Za-z.'-]*$")
+_NAME_SEPARATOR_RE = re.compile(r"\s+[-|\u2013\u2014,]\s+|,\s*")
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_PHONE_RE = re.compile(r"(?:\+?\d{1,3}[\s.-]?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}")
+_LINKEDIN_RE = re.compile(r"linkedin\.com/in/[\w-]+", re.IGNORECASE)
+
+
+def _non_empty_lines(text: str) -> List[str]:
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def _contacts(text: str) -> Set[str]:
+    """Normalised emails, phone numbers and LinkedIn URLs found in text."""
+    found = {m.lower() for m in _EMAIL_RE.findall(text)}
+    found |= {re.sub(r"\D", "", m)[-10:] for m in _PHONE_RE.findall(text)}
+    found |= {m.lower() for m in _LINKEDIN_RE.findall(text)}
+    return found
+
+
+def _header_contacts(lines: List[str]) -> Set[str]:
+    return _contacts("\n".join(lines[:HEADER_LINES]))
+
+
+def _clean(line: str) -> str:
+    return line.lstrip("#").strip().strip("*_").strip()
+
+
+def _words(text: Optional[str]) -> List[str]:
+    return [word.lower() for word in re.findall(r"[A-Za-z]+", text or "")]
+
+
+def _is_banner(text: str) -> bool:
+    words = _words(text)
+    return bool(words) and all(word in BANNER_WORDS for word in words)
+
+
+def _is_section_title(text: Optional[str]) -> bool:
+    """True for headings such as "Work Experience" or "Skills and Interests"."""
+    words = _words(text)
+    return bool(words) and all(word in SECTION_WORDS | _CONNECTIVES for word in words) \
+        and any(word in SECTION_WORDS for word in words)
+
+
+def _first_line(lines: List[str]) -> Optional[str]:
+    """First line that is not an image placeholder or a "RESUME" style banner."""
+    for line in lines[:HEADER_LINES]:
+        text = _clean(line)
+        if text and not _PLACEHOLDER_RE.match(text) and not _is_banner(text):
+            return text
+    return None
+
+
+def _looks_like_name(text: Optional[str]) -> bool:
+    """Two to four capitalised words with no digits or section keywords, e.g. "Jane Doe - Resume"."""
+    if not text:
+        return False
+    words = _NAME_SEPARATOR_RE.split(text)[0].split()
+    return 2 <= len(words) <= 4 and all(
+        _NAME_WORD_RE.match(word) and word.lower() not in SECTION_WORDS for word in words
+    )
+
+
+def _split_by_pages(pages: List[str]) -> List[str]:
+    """Group pages into candidates, starting a new one at each page with a new contact header."""
+    segments: List[List[str]] = []
+    current_contacts: Set[str] = set()
+    for page in pages:
+        lines = _non_empty_lines(page)
+        if not lines:
+            continue
+        contacts = _header_contacts(lines)
+        # Resumes that repeat their header on every page share contact details across pages,
+        # and a page opening with a section such as References continues the current resume
+        starts_candidate = (
+            bool(contacts)
+            and not contacts & current_contacts
+            and not _is_section_title(_first_line(lines))
+        )
+        if starts_candidate or not segments:
+            segments.append([])
+            current_contacts = set()
+        current_contacts |= contacts
+        segments[-1].append(page.strip())
+    return ["\n\n".join(pages) for pages in segments]
+
+
+def _split_by_headings(text: str) -> List[str]:
+    """Split at top-level headings that name a person and are followed by contact details."""
+    lines = text.splitlines()
+    boundaries = []
+    for i, line in enumerate(lines):
+        if not _HEADING_RE.match(line) or not _looks_like_name(_clean(line)):
+            continue
+        # Only look at the lines under this heading, up to the next one
+        header = [line]
+        for following in lines[i + 1:i + HEADER_LINES]:
+            if _HEADING_RE.match(following):
+                break
+            header.append(following)
+        if _header_contacts(_non_empty_lines("\n".join(header))):
+            boundaries.append(i)
+
+    if len(boundaries) < 2:
+        return [text.strip()]
+
+    # Anything before the first boundary (cover page, index) belongs to the first candidate
+    boundaries[0] = 0
+    boundaries.append(len(lines))
+    return ["\n".join(lines[start:end]).strip() for start, end in zip(boundaries, boundaries[1:])]
+
+
+def _merge_fragments(segments: List[str]) -> List[str]:
+    """
+    Merge segments that are not a whole resume into their neighbours.
+
+    Short segments at the start (a cover page or index) are prepended to the first
+    full segment. Later short segments, and segments repeating a contact header that
+    was already seen, continue the previous segment.
+    """
+    merged: List[str] = []
+    leading: List[str] = []
+    seen: Set[str] = set()
+    for segment in segments:
+        contacts = _header_contacts(_non_empty_lines(segment))
+        if not merged:
+            if len(segment) < MIN_SEGMENT_CHARS:
+                leading.append(segment)
+                continue
+            merged.append("\n\n".join(leading + [segment]))
+        elif len(segment) < MIN_SEGMENT_CHARS or contacts & seen:
+            merged[-1] += "\n\n" + segment
+        else:
+            merged.append(segment)
+        seen |= contacts
+
+    if not merged:
+        return ["\n\n".join(leading)]
+    return merged
+
+
+def split_candidates(markdown: str) -> List[str]:
+    """
+    Split a markdown document into per-candidate segments.
+
+    Page breaks are used when present, with a new candidate starting on every page
+    whose first lines contain an email, phone number or LinkedIn URL not seen on the
+    current candidate's pages. Without page breaks the document is split at headings
+    that look like a person's name and are followed by such contact details. Fragments
+    such as cover pages or repeated headers are merged into a neighbouring segment.
+    If no boundaries are found, the whole document is returned as a single segment.
+    """
+    pages = _PAGE_SPLIT_RE.split(markdown)
+    if len(pages) > 1:
+        segments = _split_by_pages(pages)
+    else:
+        segments = _split_by_headings(markdown)
+
+    segments = [s for s in segments if s]
+    if len(segments) <= 1:
+        return segments or [markdown]
+
+    merged = _merge_fragments(segments)
+    if len(merged) == 1:
+        logger.warning(
+            "Found %d candidate boundaries but every segment was a fragment; "
+            "scoring the document as a single segment", len(segments) - 1
+        )
+    return merged
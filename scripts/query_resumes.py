@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Resume Query Script using the local embedding index
+
+This script searches previously analysed resumes by semantic similarity,
+without calling an LLM. The index is built from the saved markdown and
+review JSON files and is updated incrementally before each query.
+
+Usage:
+    python scripts/query_resumes.py --results results/ --query "RAG experience at Amazon"
+    python scripts/query_resumes.py --results results/ --like "Jane Doe" --top-k 5
+    python scripts/query_resumes.py -r results/ -q "LLM agents" --records --kind resume
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List, Any
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.index import VectorIndex, LocalEmbedder, INDEX_DIR_NAME, DEFAULT_EMBEDDING_MODEL
+
+
+def print_ranked_candidates(candidates: List[Any]) -> None:
+    """Print candidates re-ranked by similarity to the query."""
+    if not candidates:
+        print("No matching candidates found.")
+        return
+
+    for i, candidate in enumerate(candidates, 1):
+        print(f"\n{i}. {candidate['name']} (similarity: {candidate['similarity']:.3f})")
+        if 'ai_ml_experience_score' in candidate:
+            print(f"   AI/ML Experience Score: {candidate['ai_ml_experience_score']}/10")
+            print(f"   Well-Known Company Experience: {candidate['well_known_software_company_experience']} years")
+            print(f"   Analysis: {candidate['reason_for_score']}")
+
+
+def print_records(records: List[Any]) -> None:
+    """Print nearest-neighbour records with a short text excerpt."""
+    if not records:
+        print("No matching records found.")
+        return
+
+    for i, record in enumerate(records, 1):
+        excerpt = " ".join(record['text'].split())[:200]
+        print(f"\n{i}. [{record['kind']}] {record['name'] or 'Unknown'} - {record['source']} (similarity: {record['similarity']:.3f})")
+        print(f"   {excerpt}")
+
+
+def main():
+    """Main function to update the index and run a similarity query."""
+    parser = argparse.ArgumentParser(
+        description="Search analysed resumes by semantic similarity using a local embedding index",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Candidates matching a free-text question
+  python scripts/query_resumes.py -r results/ -q "RAG experience at Amazon"
+  
+  # Candidates similar to an existing hire
+  python scripts/query_resumes.py -r results/ --like "Jane Doe"
+  
+  # Raw nearest-neighbour resume segments
+  python scripts/query_resumes.py -r results/ -q "fine-tuning LLMs" --records --kind resume
+        """
+    )
+
+    parser.add_argument(
+        '--results', '-r',
+        default='resume_analysis_results',
+        help='Directory containing analysis results (default: resume_analysis_results)'
+    )
+
+    query_group = parser.add_mutually_exclusive_group(required=True)
+    query_group.add_argument(
+        '--query', '-q',
+        help='Free-text query to search for'
+    )
+    query_group.add_argument(
+        '--like', '-l',
+        help='Name of an indexed candidate to find similar candidates to'
+    )
+
+    parser.add_argument(
+        '--top-k', '-k',
+        type=int,
+        default=10,
+        help='Number of results to return (default: 10)'
+    )
+
+    parser.add_argument(
+        '--records',
+        action='store_true',
+        help='Return individual nearest-neighbour records instead of ranked candidates'
+    )
+
+    parser.add_argument(
+        '--kind',
+        choices=['review', 'resume'],
+        help='Restrict --records results to reviews or resume segments'
+    )
+
+    parser.add_argument(
+        '--embedding-model',
+        default=DEFAULT_EMBEDDING_MODEL,
+        help=f'Embedding model to use (default: {DEFAULT_EMBEDDING_MODEL})'
+    )
+
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.results):
+        print(f"Results directory not found: {args.results}")
+        sys.exit(1)
+
+    index = VectorIndex(
+        os.path.join(args.results, INDEX_DIR_NAME),
+        LocalEmbedder(args.embedding_model)
+    )
+    added = index.update(args.results)
+    if added:
+        print(f"Indexed {added} new record(s)")
+
+    if args.query:
+        # Load the model first so the reported time covers only the query itself
+        index.embedder.load()
+
+    start = time.perf_counter()
+    if args.like:
+        try:
+            query = index.candidate_vector(args.like)
+        except ValueError as e:
+            print(str(e))
+            sys.exit(1)
+    else:
+        query = index.embedder.embed([args.query])[0]
+
+    if args.records:
+        print_records(index.search(query, top_k=args.top_k, kind=args.kind))
+    else:
+        top_k = args.top_k + 1 if args.like else args.top_k
+        candidates = index.rank_candidates(query, top_k=top_k)
+        if args.like:
+            # The reference candidate is always its own nearest neighbour
+            candidates = [c for c in candidates if c['name'].strip().lower() != args.like.strip().lower()]
+        print_ranked_candidates(candidates[:args.top_k])
+
+    print(f"\nQuery completed in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import os
+import sys
+import time
+import types
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.parser import conversion_worker
+from scripts.parser.conversion_worker import CRASHED, ERROR, OK, TIMEOUT, ConversionWorker, run_isolated
+
+
+def fake_worker(conn, config):
+    """Stand-in for docling_worker whose behaviour is chosen by the config and file name."""
+    if config.get("fail_start"):
+        conn.send((ERROR, "no models", 0.0))
+        return
+    time.sleep(config.get("startup_delay", 0))
+    conn.send(("ready", None, 0.0))
+
+    while True:
+        request = conn.recv()
+        if request is None:
+            break
+        (file_path,) = request
+        if file_path == "slow":
+            time.sleep(30)
+        if file_path == "crash":
+            os._exit(1)
+        if file_path == "bad":
+            conn.send((ERROR, "too many pages", 0.0))
+            continue
+        rss_mb = 5000.0 if file_path == "big" else 10.0
+        conn.send((OK, f"{file_path}:{os.getpid()}", rss_mb))
+
+
+def fake_once(conn, file_path):
+    """Stand-in for markitdown_worker."""
+    if file_path == "slow":
+        time.sleep(30)
+    conn.send((OK, f"md:{file_path}", 0.0))
+    conn.close()
+
+
+def make_worker(timeout=2.0, max_documents=50, max_rss_mb=1000, **config):
+    return ConversionWorker(
+        fake_worker,
+        config,
+        timeout=timeout,
+        startup_timeout=10,
+        max_documents=max_documents,
+        max_rss_mb=max_rss_mb
+    )
+
+
+def pid(payload):
+    return int(payload.split(":")[1])
+
+
+def test_recycles_after_max_documents():
+    worker = make_worker(max_documents=2)
+    try:
+        first = worker.convert("a")
+        second = worker.convert("a")
+        assert worker.process is None
+        third = worker.convert("a")
+        assert [s for s, _ in (first, second, third)] == [OK, OK, OK]
+        assert pid(first[1]) == pid(second[1]) != pid(third[1])
+    finally:
+        worker.stop()
+
+
+def test_recycles_above_rss_limit():
+    worker = make_worker()
+    try:
+        assert worker.convert("a")[0] == OK
+        assert worker.process is not None
+        assert worker.convert("big")[0] == OK
+        assert worker.process is None
+    finally:
+        worker.stop()
+
+
+def test_timeout_kills_worker():
+    worker = make_worker(timeout=1.0)
+    try:
+        assert worker.convert("a")[0] == OK
+        process = worker.process
+        status, message = worker.convert("slow")
+        assert status == TIMEOUT and "timed out" in message
+        assert worker.process is None
+        assert worker.convert("a")[0] == OK
+    finally:
+        worker.stop()
+    assert not process.is_alive()
+
+
+def test_startup_is_not_charged_to_the_first_document():
+    worker = make_worker(timeout=1.0, startup_delay=1.5)
+    try:
+        assert worker.convert("a")[0] == OK
+    finally:
+        worker.stop()
+
+
+def test_crash_is_reported_and_worker_restarts():
+    worker = make_worker()
+    try:
+        assert worker.convert("crash")[0] == CRASHED
+        assert worker.process is None
+        assert worker.convert("a")[0] == OK
+    finally:
+        worker.stop()
+
+
+def test_conversion_error_keeps_worker():
+    worker = make_worker()
+    try:
+        assert worker.convert("bad") == (ERROR, "too many pages")
+        assert worker.process is not None
+    finally:
+        worker.stop()
+
+
+def test_startup_error_is_sticky(monkeypatch):
+    worker = make_worker(fail_start=True)
+    status, message = worker.convert("a")
+    assert status == ERROR and "no models" in message
+
+    monkeypatch.setattr(worker, "_start", lambda: pytest.fail("worker restarted after startup error"))
+    assert worker.convert("a") == (ERROR, message)
+
+
+def test_run_isolated():
+    assert run_isolated(fake_once, ("a",), timeout=5) == (OK, "md:a")
+    status, message = run_isolated(fake_once, ("slow",), timeout=1)
+    assert status == TIMEOUT and "timed out" in message
+
+
+def test_rss_without_proc_or_resource(monkeypatch):
+    def no_proc(*args, **kwargs):
+        raise OSError("no /proc")
+
+    # As on Windows: no /proc and no resource module
+    monkeypatch.setattr(conversion_worker, "open", no_proc, raising=False)
+    monkeypatch.setitem(sys.modules, "resource", None)
+    assert conversion_worker.current_rss_mb() == 0.0
+
+
+def test_rss_from_peak_usage_on_macos(monkeypatch):
+    def no_proc(*args, **kwargs):
+        raise OSError("no /proc")
+
+    fake_resource = types.SimpleNamespace(
+        RUSAGE_SELF=0,
+        getrusage=lambda who: types.SimpleNamespace(ru_maxrss=512 * 1024 * 1024),
+    )
+    monkeypatch.setattr(conversion_worker, "open", no_proc, raising=False)
+    monkeypatch.setitem(sys.modules, "resource", fake_resource)
+    monkeypatch.setattr(sys, "platform", "darwin")
+    assert conversion_worker.current_rss_mb() == 512
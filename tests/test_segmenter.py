@@ -0,0 +1,94 @@
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.parser.segmenter import PAGE_BREAK, split_candidates
+
+BODY = (
+    "Senior software engineer with eight years of experience building distributed systems, "
+    "training and deploying machine learning models, and leading small product teams. "
+    "Shipped retrieval augmented generation services used by millions of customers."
+)
+
+
+def resume(opening: str, name: str, email: str, phone: str = "555-123-4567") -> str:
+    return f"{opening}\n# {name}\n{email} | {phone}\n\n## Experience\n{BODY}"
+
+
+def test_single_resume_with_contact_details_in_sections():
+    markdown = (
+        "# Jane Doe\njane@x.com\n\n"
+        f"## Experience\nMachine Learning Engineer, Amazon. Team line 555-123-4567.\n{BODY}\n\n"
+        "## References\nBob Smith, bob@corp.com"
+    )
+    assert split_candidates(markdown) == [markdown]
+
+
+def test_single_resume_with_references_page():
+    markdown = f"# Jane Doe\njane@x.com\n{BODY}\n{PAGE_BREAK}\n## References\nBob Smith\nbob@corp.com\n{BODY}"
+    assert len(split_candidates(markdown)) == 1
+
+
+def test_resume_repeating_header_on_every_page():
+    markdown = f"# Jane Doe\njane@x.com\n{BODY}\n{PAGE_BREAK}\nJane Doe\njane@x.com\n{BODY}"
+    assert len(split_candidates(markdown)) == 1
+
+
+def test_pages_with_same_opening_line():
+    for opening in ["<!-- image -->", "RESUME", "CURRICULUM VITAE"]:
+        markdown = f"\n{PAGE_BREAK}\n".join([
+            resume(opening, "Jane Doe", "jane@x.com"),
+            resume(opening, "Bob Roe", "bob@y.org", "555-987-6543"),
+        ])
+        segments = split_candidates(markdown)
+        assert len(segments) == 2
+        assert "Jane Doe" in segments[0] and "Bob Roe" in segments[1]
+
+
+def packet(count: int) -> list:
+    return [resume("", f"Candidate {chr(65 + i // 26)}{chr(97 + i % 26)} Doe", f"c{i}@x.com", f"555-{i:03d}-9876")
+            for i in range(count)]
+
+
+def test_large_packet():
+    assert len(split_candidates(f"\n{PAGE_BREAK}\n".join(packet(50)))) == 50
+
+
+def test_short_resume_is_merged_into_previous_segment():
+    resumes = packet(50)
+    resumes[10] = "# Tom Short\ntom@short.com\nIntern."
+    segments = split_candidates(f"\n{PAGE_BREAK}\n".join(resumes))
+    assert len(segments) == 49
+    assert "Tom Short" in segments[9]
+
+
+def test_cover_page_is_merged_into_first_segment():
+    cover = "Candidates for the ML Engineer role\nrecruiter@agency.com | 555-000-1111"
+    segments = split_candidates(f"\n{PAGE_BREAK}\n".join([cover] + packet(50)))
+    assert len(segments) == 50
+    assert segments[0].startswith("Candidates for the ML Engineer role")
+
+
+def test_fragments_only_fall_back_to_one_segment(caplog):
+    markdown = f"\n{PAGE_BREAK}\n".join(["# Ann Lee\nann@x.com", "# Ben Ray\nben@y.org"])
+    with caplog.at_level("WARNING"):
+        segments = split_candidates(markdown)
+    assert len(segments) == 1
+    assert "single segment" in caplog.text
+
+
+def test_headings_without_page_breaks():
+    markdown = "Candidate packet\n\n" + "\n\n".join([
+        resume("", "Jane Doe", "jane@x.com"),
+        resume("", "Bob Roe - Resume", "bob@y.org", "555-987-6543"),
+    ])
+    segments = split_candidates(markdown)
+    assert len(segments) == 2
+    assert segments[0].startswith("Candidate packet")
+    assert "Bob Roe" in segments[1]
+
+
+def test_no_boundaries():
+    assert split_candidates("just one resume") == ["just one resume"]
@@ -0,0 +1,156 @@
+import json
+import os
+import sys
+import threading
+import zlib
+
+import numpy as np
+import pytest
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.index.vector_index import COMPACT_STALE_FRACTION, VectorIndex, _exclusive_lock
+
+
+class FakeEmbedder:
+    """Deterministic bag-of-words embedding, so identical texts have similarity 1."""
+
+    model_name = "fake"
+    dim = 64
+
+    def embed(self, texts):
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[i, zlib.crc32(word.encode()) % self.dim] += 1
+            vectors[i] /= np.linalg.norm(vectors[i])
+        return vectors
+
+
+def write_result(results_dir, stem, name, reason):
+    review = {
+        "name": name,
+        "ai_ml_experience_score": 8,
+        "well_known_software_company_experience": 3,
+        "reason_for_score": reason,
+    }
+    with open(os.path.join(results_dir, f"{stem}.json"), "w") as f:
+        json.dump([review], f)
+
+
+def open_index(results_dir):
+    return VectorIndex(os.path.join(results_dir, "index"), FakeEmbedder())
+
+
+def assert_aligned(index):
+    """Every current record's vector is the embedding of its own text."""
+    for record in index.records:
+        if index._is_current(record):
+            expected = FakeEmbedder().embed([record["text"]])[0]
+            np.testing.assert_allclose(index.vectors[record["row"]], expected, rtol=1e-6)
+
+
+@pytest.fixture
+def results_dir(tmp_path):
+    write_result(tmp_path, "a", "Jane Doe", "built RAG systems at Amazon with LLM agents")
+    write_result(tmp_path, "b", "Bob Roe", "java backend services with spring")
+    return str(tmp_path)
+
+
+def test_incremental_update(results_dir):
+    index = open_index(results_dir)
+    assert index.update(results_dir) == 2
+    assert index.update(results_dir) == 0
+
+    write_result(results_dir, "c", "Cat Poe", "pytorch fine tuning of vision models")
+    index = open_index(results_dir)
+    assert index.update(results_dir) == 1
+    assert [r["row"] for r in index.records] == [0, 1, 2]
+    assert_aligned(index)
+
+    hit = index.search(FakeEmbedder().embed(["pytorch fine tuning of vision models"])[0], top_k=1)[0]
+    assert hit["name"] == "Cat Poe"
+    assert hit["similarity"] == pytest.approx(1.0)
+
+
+def test_orphan_rows_are_truncated(results_dir):
+    index = open_index(results_dir)
+    index.update(results_dir)
+
+    # A crash after appending but before saving metadata leaves extra rows
+    with open(index.vectors_file, "ab") as f:
+        f.write(FakeEmbedder().embed(["orphaned row", "another orphaned row"]).tobytes())
+
+    write_result(results_dir, "c", "Cat Poe", "pytorch fine tuning of vision models")
+    index = open_index(results_dir)
+    index.update(results_dir)
+    assert os.path.getsize(index.vectors_file) == 3 * FakeEmbedder.dim * 4
+    assert_aligned(index)
+
+
+def test_deleted_results_are_pruned(results_dir):
+    index = open_index(results_dir)
+    index.update(results_dir)
+
+    os.remove(os.path.join(results_dir, "b.json"))
+    index.update(results_dir)
+
+    names = [c["name"] for c in index.rank_candidates(FakeEmbedder().embed(["java"])[0])]
+    assert names == ["Jane Doe"]
+    with pytest.raises(ValueError):
+        index.candidate_vector("Bob Roe")
+
+
+def test_compaction_renumbers_rows(results_dir):
+    index = open_index(results_dir)
+    index.update(results_dir)
+
+    # Replacing one of two results leaves 1 of 3 rows stale, above the compaction threshold
+    assert 1 / 3 > COMPACT_STALE_FRACTION
+    write_result(results_dir, "a", "Jane Doe", "built RAG systems at Google")
+    index.update(results_dir)
+
+    assert index.metadata["rows"] == 2
+    assert sorted(r["row"] for r in index.records) == [0, 1]
+    assert os.path.basename(index.vectors_file) == "vectors-1.f32"
+    assert sorted(f for f in os.listdir(index.index_dir) if f.endswith(".f32")) == ["vectors-1.f32"]
+    assert_aligned(index)
+    assert open_index(results_dir).candidate_vector("Jane Doe") is not None
+
+
+def test_overlapping_instances_stay_aligned(results_dir):
+    first = open_index(results_dir)
+    second = open_index(results_dir)
+
+    write_result(results_dir, "c", "Cat Poe", "pytorch fine tuning of vision models")
+    second.update(results_dir)
+    write_result(results_dir, "d", "Dan Moe", "kubernetes and terraform infrastructure")
+    first.update(results_dir)
+
+    index = open_index(results_dir)
+    assert index.metadata["rows"] == 4
+    assert_aligned(index)
+
+
+def test_update_waits_for_lock(results_dir):
+    index = open_index(results_dir)
+    os.makedirs(index.index_dir, exist_ok=True)
+
+    with _exclusive_lock(index.lock_file):
+        thread = threading.Thread(target=index.update, args=(results_dir,))
+        thread.start()
+        thread.join(timeout=0.5)
+        assert thread.is_alive()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert index.metadata["rows"] == 2
+
+
+def test_model_mismatch(results_dir):
+    open_index(results_dir).update(results_dir)
+
+    other = FakeEmbedder()
+    other.model_name = "other"
+    with pytest.raises(ValueError, match="built with fake"):
+        VectorIndex(os.path.join(results_dir, "index"), other)